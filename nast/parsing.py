@@ -1,18 +1,19 @@
 """Stan parser."""
-from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Tuple, Union
+from typing import (Any, Collection, Container, Iterable, List, NamedTuple,
+                    Optional, Tuple, Union)
 
 from nast import expr
 from nast import stmt
 from nast.tokens import Token, TokenType
 
 # Data types that with no dimensions
-SCALAR_VAR_TYPES = [
+SCALAR_VAR_TYPES = frozenset({
     TokenType.INT,
     TokenType.REAL,
-]
+})
 
 # Data types that with one dimension
-ONE_DIM_VAR_TYPES = [
+ONE_DIM_VAR_TYPES = frozenset({
     TokenType.VECTOR,
     TokenType.ORDERED,
     TokenType.POSITIVEORDERED,
@@ -22,53 +23,65 @@ ONE_DIM_VAR_TYPES = [
     TokenType.CHOLESKYFACTORCORR,
     TokenType.CORRMATRIX,
     TokenType.COVMATRIX,
-]
+})
 
-BASIC_TYPES = [
+BASIC_TYPES = frozenset({
     TokenType.INT,
     TokenType.REAL,
     TokenType.COMPLEX,
     TokenType.VECTOR,
     TokenType.ROWVECTOR,
     TokenType.MATRIX,
-]
+})
 
 # Types that can have literal values in the code
-LITERAL_TYPES = [
+LITERAL_TYPES = frozenset({
     TokenType.STRING, TokenType.INTNUMERAL, TokenType.REALNUMERAL,
     TokenType.IMAGNUMERAL
-]
+})
 
-RETURN_TYPE_TTYPES = [TokenType.VOID, TokenType.ARRAY] + BASIC_TYPES
+RETURN_TYPE_TTYPES = frozenset({TokenType.VOID, TokenType.ARRAY}) | BASIC_TYPES
 
 # Data types that with two dimensions
-TWO_DIM_VAR_TYPES = [TokenType.MATRIX]
+TWO_DIM_VAR_TYPES = frozenset({TokenType.MATRIX})
 
 # Data types that with one or two dimensions
-OPT_TWO_DIM_VAR_TYPES = [TokenType.CHOLESKYFACTORCOV]
+OPT_TWO_DIM_VAR_TYPES = frozenset({TokenType.CHOLESKYFACTORCOV})
+
+# Numbers of required and optional type dimensions per data type; scalar
+# types have no type dimensions and are omitted
+TYPE_DIM_ARITIES = {
+    **dict.fromkeys(ONE_DIM_VAR_TYPES, (1, 0)),
+    **dict.fromkeys(TWO_DIM_VAR_TYPES, (2, 0)),
+    **dict.fromkeys(OPT_TWO_DIM_VAR_TYPES, (1, 1)),
+}
 
 # All data types
-VAR_TYPES = (SCALAR_VAR_TYPES + ONE_DIM_VAR_TYPES + TWO_DIM_VAR_TYPES +
-             OPT_TWO_DIM_VAR_TYPES)
+VAR_TYPES = (SCALAR_VAR_TYPES | ONE_DIM_VAR_TYPES | TWO_DIM_VAR_TYPES
+             | OPT_TWO_DIM_VAR_TYPES)
+
+# Keywords starting offset/multiplier or lower/upper constraints
+OFFSET_MULTIPLIER = frozenset({TokenType.OFFSET, TokenType.MULTIPLIER})
+LOWER_UPPER = frozenset({TokenType.LOWER, TokenType.UPPER})
 
 # Data types that may have upper/lower constraints.
-LOWER_UPPER_CONSTRAINT_VAR_TYPES = [
+LOWER_UPPER_CONSTRAINT_VAR_TYPES = frozenset({
     TokenType.INT,
     TokenType.REAL,
     TokenType.VECTOR,
     TokenType.ROWVECTOR,
     TokenType.MATRIX,
-]
+})
 
 # Data types that may have offset/multiplier constraints.
-OFFSET_MULTIPLIER_CONSTRAINT_VAR_TYPES = [
+OFFSET_MULTIPLIER_CONSTRAINT_VAR_TYPES = frozenset({
     TokenType.REAL,
     TokenType.VECTOR,
     TokenType.ROWVECTOR,
     TokenType.MATRIX,
-]
+})
 
-ASSIGNMENT_OPS = [
+ASSIGNMENT_OPS = frozenset({
     TokenType.ASSIGN,
     TokenType.ARROWASSIGN,
     TokenType.PLUSASSIGN,
@@ -77,7 +90,64 @@ ASSIGNMENT_OPS = [
     TokenType.DIVIDEASSIGN,
     TokenType.ELTTIMESASSIGN,
     TokenType.ELTDIVIDEASSIGN,
-]
+})
+
+# Keywords of variable constraints mapped to their names
+CONSTRAINT_NAMES = {
+    TokenType.LOWER: "lower",
+    TokenType.UPPER: "upper",
+    TokenType.OFFSET: "offset",
+    TokenType.MULTIPLIER: "multiplier",
+}
+
+# Unary prefix operators
+UNARY_OPS = frozenset({TokenType.BANG, TokenType.MINUS, TokenType.PLUS})
+
+# Right associative binary infix power operators `^` and `.^` (elementwise)
+POWER_OPS = frozenset({TokenType.HAT, TokenType.ELTPOW})
+
+# Precedence levels of left associative binary infix operators. Lower levels
+# bind more tightly, see the Stan reference manual.
+BINARY_OP_PRECEDENCES = {
+    TokenType.OR: 9,  # `||` logical or
+    TokenType.AND: 8,  # `&&` logical and
+    TokenType.EQUALS: 7,  # `==` equality
+    TokenType.NEQUALS: 7,  # `!=` inequality
+    TokenType.LABRACK: 6,  # `<` less than
+    TokenType.LEQ: 6,  # `<=` less than or equal
+    TokenType.RABRACK: 6,  # `>` greater than
+    TokenType.GEQ: 6,  # `>=` greater than or equal
+    TokenType.PLUS: 5,  # `+` addition
+    TokenType.MINUS: 5,  # `-` subtraction
+    TokenType.TIMES: 4,  # `*` multiplication
+    TokenType.DIVIDE: 4,  # `/` (right) division
+    TokenType.MODULO: 4,  # `%` modulus
+    TokenType.LDIVIDE: 3,  # `\` left division
+    TokenType.ELTTIMES: 2,  # `.*` elementwise multiplication
+    TokenType.ELTDIVIDE: 2,  # `./` elementwise division
+}
+
+# BINARY_OP_PRECEDENCES as a list indexed by token type, 0 for non-operators
+BINARY_OP_PRECEDENCE_TABLE: List[int] = [0] * (max(TokenType) + 1)
+for _ttype, _level in BINARY_OP_PRECEDENCES.items():
+    BINARY_OP_PRECEDENCE_TABLE[_ttype] = _level
+
+# Names of Parser methods parsing statements, keyed by the type of the first
+# token of the statement. The methods assume that this token is consumed.
+# Statements starting with any other token are assignments or tildes.
+STATEMENT_PARSERS = {
+    TokenType.BREAK: "_parse_break",
+    TokenType.CONTINUE: "_parse_continue",
+    TokenType.RETURN: "_parse_return",
+    TokenType.IF: "_parse_if_else",
+    TokenType.WHILE: "_parse_while",
+    TokenType.FOR: "_parse_for",
+    TokenType.PRINT: "_parse_print",
+    TokenType.REJECT: "_parse_reject",
+    TokenType.TARGET: "_parse_target_plus_assign",
+    TokenType.LBRACE: "_parse_block",
+    TokenType.SEMICOLON: "_parse_empty",
+}
 
 
 class ParseError(Exception):
@@ -98,9 +168,21 @@ class VarConstraints(NamedTuple):
 class Parser:
     """Stan parser."""
 
-    # pylint: disable=too-few-public-methods
+    # pylint: disable=too-few-public-methods, attribute-defined-outside-init
+
+    def __init__(self, token_list: Iterable[Token]):
+        self.reset(token_list)
+
+    def reset(self, token_list: Iterable[Token]) -> None:
+        """Reset parser state to parse a new list of tokens.
 
-    def __init__(self, token_list: List[Token]):
+        This allows to reuse a single Parser instance for multiple token lists.
+
+        Args:
+            token_list: tokens to be parsed, terminated by an EOF token. An
+                iterator, e.g. Scanner.iter_tokens(), is consumed completely
+                here, as the parser accesses tokens by index.
+        """
         self._token_list = list(token_list)
         self._current = 0
 
@@ -111,15 +193,12 @@ class Parser:
     def _pop_token(self):
         token = self._peek()
 
-        if not self._is_at_end():
+        # The token list is terminated by EOF, never advance beyond it.
+        if token.ttype != TokenType.EOF:
             self._current += 1
 
         return token
 
-    def _is_at_end(self) -> bool:
-        """Check if EOF encountered yet."""
-        return self._peek().ttype == TokenType.EOF
-
     def _peek(self) -> Token:
         """Peek at current element."""
         return self._token_list[self._current]
@@ -132,34 +211,35 @@ class Parser:
         """Return previous token."""
         return self._token_list[self._current - 1]
 
-    def _check_any(self, *args: TokenType) -> bool:
-        """Check if current token has 1 of given TokenTypes, but not consume."""
-        if self._is_at_end():
-            return False
-
-        return self._peek().ttype in args
+    def _check_in(self, ttypes: Container[TokenType]) -> bool:
+        """Check if current token has one of ttypes, but not consume."""
+        ttype = self._peek().ttype
+        return ttype != TokenType.EOF and ttype in ttypes
 
     def _check(self, ttype: TokenType) -> bool:
         """Check if current token has TokenType, but not consume."""
-        return self._check_any(ttype)
+        current_ttype = self._peek().ttype
+        return current_ttype == ttype and current_ttype != TokenType.EOF
 
-    def _match_any(self, *args: TokenType) -> bool:
+    def _match_in(self, ttypes: Container[TokenType]) -> bool:
         """Check if current has one of given TokenTypes, consume if it does."""
-        for ttype in args:
-            if self._check(ttype):
-                self._pop_token()
-                return True
+        if self._check_in(ttypes):
+            self._pop_token()
+            return True
         return False
 
     def _match(self, ttype: TokenType) -> bool:
         """Check if current has TokenType, and consume if it does."""
-        return self._match_any(ttype)
+        if self._check(ttype):
+            self._pop_token()
+            return True
+        return False
 
     def _consume_any(self,
-                     ttypes: List[TokenType],
+                     ttypes: Collection[TokenType],
                      message: Optional[str] = None) -> Token:
         """Consume token of required type or raise error."""
-        if self._check_any(*ttypes):
+        if self._check_in(ttypes):
             return self._pop_token()
 
         raise ParseError(
@@ -170,12 +250,11 @@ class Parser:
                  ttype: TokenType,
                  message: Optional[str] = None) -> Token:
         """Consume token of required type or raise error."""
-        return self._consume_any([ttype], message=message)
+        if self._check(ttype):
+            return self._pop_token()
 
-    def _parse_expression(self) -> expr.Expr:
-        # <expression> ::= <lhs>
-        #        | <non_lhs>
-        return self._parse_precedence_10()
+        raise ParseError(self._get_current(), message
+                         or f"Expected {str(ttype)}.")
 
     def _parse_precedence_10(self) -> expr.Expr:
         """Precedence level 10.
@@ -186,7 +265,7 @@ class Parser:
         # a ? b : c ? d : e    is equivalent to   a ? b : (c ? d : e)
         # It is also implied that
         # a ? b ? c : d : e   is equivalent to   a ? (b ? c : d) : e
-        expression = self._parse_precedence_9()
+        expression = self._parse_binary(9)
 
         while self._match(TokenType.QMARK):
             left_operator = self._previous()
@@ -199,131 +278,42 @@ class Parser:
 
         return expression
 
-    def _parse_precedence_9(self) -> expr.Expr:
-        """Precedence level 9.
-
-        `||` logical or, binary infix, left associative.
-        """
-        expression = self._parse_precedence_8()
-
-        while self._match(TokenType.OR):
-            operator = self._previous()
-            right = self._parse_precedence_8()
-            expression = expr.ArithmeticBinary(expression, operator, right)
-
-        return expression
-
-    def _parse_precedence_8(self) -> expr.Expr:
-        """Precedence level 8.
-
-        `&&` logical and, binary infix, left associative.
-        """
-        expression = self._parse_precedence_7()
-
-        while self._match(TokenType.AND):
-            operator = self._previous()
-            right = self._parse_precedence_7()
-            expression = expr.ArithmeticBinary(expression, operator, right)
-
-        return expression
-
-    def _parse_precedence_7(self) -> expr.Expr:
-        """Precedence level 7.
-
-        `==' equality, binary infix, left associative,
-        `!=' inequality, binary infix, left associative.
-        """
-        expression = self._parse_precedence_6()
-
-        while self._match_any(TokenType.EQUALS, TokenType.NEQUALS):
-            operator = self._previous()
-            right = self._parse_precedence_6()
-            expression = expr.ArithmeticBinary(expression, operator, right)
-
-        return expression
-
-    def _parse_precedence_6(self) -> expr.Expr:
-        """Precedence level 6.
-
-        `<` less than, binary infix, left associative,
-        `<=` less than or equal, binary infix, left associative,
-        `>` greater than, binary infix, left associative,
-        `>=` greater than or equal, binary infix, left associative.
-        """
-        expression = self._parse_precedence_5()
-
-        while self._match_any(TokenType.LABRACK, TokenType.LEQ,
-                              TokenType.RABRACK, TokenType.GEQ):
-            operator = self._previous()
-            right = self._parse_precedence_5()
-            expression = expr.ArithmeticBinary(expression, operator, right)
-
-        return expression
-
-    def _parse_precedence_5(self) -> expr.Expr:
-        """Precedence level 5.
-
-        `+` addition, binary infix, left associative,
-        `-` subtraction, binary infix, left associative.
-        """
-        expression = self._parse_precedence_4()
-
-        while self._match_any(TokenType.PLUS, TokenType.MINUS):
-            operator = self._previous()
-            right = self._parse_precedence_4()
-            expression = expr.ArithmeticBinary(expression, operator, right)
-
-        return expression
-
-    def _parse_precedence_4(self) -> expr.Expr:
-        """Precedence level 4.
+    # <expression> ::= <lhs>
+    #        | <non_lhs>
+    # Aliased rather than wrapped, to save a call per (sub-)expression.
+    _parse_expression = _parse_precedence_10
 
-        `*` multiplication, binary infix, left associative,
-        `/` (right) division, binary infix, left associative,
-        `%` modulus, binary infix, left associative.
-        """
-        expression = self._parse_precedence_3()
-
-        while self._match_any(TokenType.TIMES, TokenType.DIVIDE,
-                              TokenType.MODULO):
-            operator = self._previous()
-            right = self._parse_precedence_3()
-            expression = expr.ArithmeticBinary(expression, operator, right)
-
-        return expression
-
-    def _parse_precedence_3(self) -> expr.Expr:
-        r"""Precedence level 3.
-
-        `\` left division, binary infix, left associative.
-        """
-        expression = self._parse_precedence_2()
-
-        while self._match(TokenType.LDIVIDE):
-            operator = self._previous()
-            right = self._parse_precedence_2()
-            expression = expr.ArithmeticBinary(expression, operator, right)
-
-        return expression
+    def _parse_binary(self, max_level: int) -> expr.Expr:
+        """Parse left associative binary infix operations (levels 2 to 9).
 
-    def _parse_precedence_2(self) -> expr.Expr:
-        """Precedence level 2.
+        Instead of descending through one method per precedence level, the
+        operator precedences are looked up in BINARY_OP_PRECEDENCE_TABLE
+        (precedence climbing).
 
-        `.*` elementwise multiplication, binary infix, left associative,
-        `./` elementwise division, binary infix, left associative.
+        Args:
+            max_level: highest (i.e. loosest binding) precedence level of
+                operators to be parsed.
         """
         expression = self._parse_precedence_1()
 
-        while self._match_any(TokenType.ELTTIMES, TokenType.ELTDIVIDE):
-            operator = self._previous()
-            right = self._parse_precedence_1()
-            expression = expr.ArithmeticBinary(expression, operator, right)
+        # Equivalent to _peek and _pop_token, inlined as this loop runs after
+        # every operand. Operators are never EOF, so _current can advance.
+        token_list = self._token_list
+        while True:
+            operator = token_list[self._current]
+            level = BINARY_OP_PRECEDENCE_TABLE[operator.ttype]
+            if not 0 < level <= max_level:
+                return expression
 
-        return expression
+            self._current += 1
+            # Operands may only contain operators binding more tightly,
+            # which makes the operator left associative.
+            right = self._parse_binary(level - 1)
+            expression = expr.ArithmeticBinary(expression, operator, right)
 
     def _parse_precedence_1(self) -> expr.Expr:
         """Precedence level 1. Unary prefix operators `!`, `-` and `+`."""
-        if self._match_any(TokenType.BANG, TokenType.MINUS, TokenType.PLUS):
+        if self._match_in(UNARY_OPS):
             operator = self._previous()
             right = self._parse_precedence_1()
             return expr.Unary(operator, right)
@@ -332,11 +322,11 @@ class Parser:
     def _parse_precedence_0_5(self) -> expr.Expr:
         """Precedence level 0.5.
 
-        Binary infix `^`, right associative.
+        Binary infix `^` and `.^`, right associative.
         """
         expression = self._parse_precedence_0()
 
-        while self._match(TokenType.HAT):
+        while self._match_in(POWER_OPS):
             operator = self._previous()
             right = self._parse_precedence_0_5()
             expression = expr.ArithmeticBinary(expression, operator, right)
@@ -419,7 +409,7 @@ class Parser:
         return expression
 
     def _parse_primary(self) -> expr.Expr:
-        if self._check_any(*LITERAL_TYPES):
+        if self._check_in(LITERAL_TYPES):
             return expr.Literal(self._pop_token())
 
         if self._match(TokenType.LPAREN):
@@ -457,7 +447,10 @@ class Parser:
                                 type_dims=type_dims,
                                 array_dims=array_dims,
                                 initializer=initializer,
-                                **var_constraints._asdict())
+                                lower=var_constraints.lower,
+                                upper=var_constraints.upper,
+                                offset=var_constraints.offset,
+                                multiplier=var_constraints.multiplier)
 
     def _parse_declaration_no_assign(
             self, error_msg_if_init: str) -> stmt.Declaration:
@@ -479,23 +472,20 @@ class Parser:
         return declaration
 
     def _parse_type_dims(self, ttype: TokenType) -> List[expr.Expr]:
-        type_dims = []
-        if ttype in ONE_DIM_VAR_TYPES:
-            self._consume(TokenType.LBRACK, "Expected '['.")
-            type_dims.append(self._parse_expression())
-            self._consume(TokenType.RBRACK, "Expected ']'.")
-        elif ttype in TWO_DIM_VAR_TYPES:
-            self._consume(TokenType.LBRACK, "Expected '['.")
-            type_dims.append(self._parse_expression())
+        num_dims, num_optional_dims = TYPE_DIM_ARITIES.get(ttype, (0, 0))
+        if not num_dims:
+            return []
+
+        self._consume(TokenType.LBRACK, "Expected '['.")
+        type_dims = [self._parse_expression()]
+        for _ in range(1, num_dims):
             self._consume(TokenType.COMMA, "Expected ','.")
             type_dims.append(self._parse_expression())
-            self._consume(TokenType.RBRACK, "Expected ']'.")
-        elif ttype in OPT_TWO_DIM_VAR_TYPES:
-            self._consume(TokenType.LBRACK, "Expected '['.")
+        for _ in range(num_optional_dims):
+            if not self._match(TokenType.COMMA):
+                break
             type_dims.append(self._parse_expression())
-            if self._match(TokenType.COMMA):
-                type_dims.append(self._parse_expression())
-            self._consume(TokenType.RBRACK, "Expected ']'.")
+        self._consume(TokenType.RBRACK, "Expected ']'.")
 
         return type_dims
 
@@ -516,138 +506,185 @@ class Parser:
 
     def _parse_lower_upper_offset_multiplier(self,
                                              dtype: Token) -> VarConstraints:
-        kwargs: Dict[str, Optional[expr.Expr]] = dict(lower=None,
-                                                      upper=None,
-                                                      offset=None,
-                                                      multiplier=None)
-        if self._match(TokenType.LABRACK):
-            if (self._check_any(TokenType.OFFSET, TokenType.MULTIPLIER)
-                    and dtype.ttype in OFFSET_MULTIPLIER_CONSTRAINT_VAR_TYPES):
-                kwargs |= self._parse_var_constraints(TokenType.OFFSET,
-                                                      TokenType.MULTIPLIER)
-            elif (self._check_any(TokenType.LOWER, TokenType.UPPER)
-                  and dtype.ttype in LOWER_UPPER_CONSTRAINT_VAR_TYPES):
-                kwargs |= self._parse_var_constraints(TokenType.LOWER,
-                                                      TokenType.UPPER)
-            else:
-                expected_keywords = ', '.join([
-                    ttype.name.lower() for ttype in [
-                        TokenType.MULTIPLIER, TokenType.OFFSET,
-                        TokenType.LOWER, TokenType.UPPER
-                    ]
-                ])
-                raise ParseError(self._get_current(),
-                                 f"Expected {expected_keywords}.")
-
-            self._consume(TokenType.RABRACK,
-                          "Expect '>' after var constraints.")
-
-        return VarConstraints(**kwargs)
+        if not self._match(TokenType.LABRACK):
+            return VarConstraints()
+
+        if (self._check_in(OFFSET_MULTIPLIER)
+                and dtype.ttype in OFFSET_MULTIPLIER_CONSTRAINT_VAR_TYPES):
+            offset, multiplier = self._parse_var_constraints(
+                TokenType.OFFSET, TokenType.MULTIPLIER)
+            var_constraints = VarConstraints(offset=offset,
+                                             multiplier=multiplier)
+        elif (self._check_in(LOWER_UPPER)
+              and dtype.ttype in LOWER_UPPER_CONSTRAINT_VAR_TYPES):
+            lower, upper = self._parse_var_constraints(TokenType.LOWER,
+                                                       TokenType.UPPER)
+            var_constraints = VarConstraints(lower=lower, upper=upper)
+        else:
+            expected_keywords = ', '.join([
+                CONSTRAINT_NAMES[ttype] for ttype in [
+                    TokenType.MULTIPLIER, TokenType.OFFSET, TokenType.LOWER,
+                    TokenType.UPPER
+                ]
+            ])
+            raise ParseError(self._get_current(),
+                             f"Expected {expected_keywords}.")
+
+        self._consume(TokenType.RABRACK, "Expect '>' after var constraints.")
+
+        return var_constraints
 
     def _parse_var_constraints(
-            self, ttype_0: TokenType,
-            ttype_1: TokenType) -> Mapping[str, Optional[expr.Expr]]:
-        constraints: Dict[str, Optional[expr.Expr]] = {
-            ttype_0.name.lower(): None,
-            ttype_1.name.lower(): None
-        }
+            self, ttype_0: TokenType, ttype_1: TokenType
+    ) -> Tuple[Optional[expr.Expr], Optional[expr.Expr]]:
+        """Parse a pair of constraints, e.g. lower and upper.
+
+        Returns:
+            The expressions given for ttype_0 and ttype_1, None for a missing
+            constraint.
+        """
+        constraints: List[Optional[expr.Expr]] = [None, None]
+        ttypes = (ttype_0, ttype_1)
 
         while True:
-            if not self._match_any(ttype_0, ttype_1):
+            if not self._match_in(ttypes):
                 raise ParseError(
-                    self._get_current(), f"Expected '{ttype_0.name.lower()}' "
-                    f"or '{ttype_1.name.lower()}', but found "
+                    self._get_current(),
+                    f"Expected '{CONSTRAINT_NAMES[ttype_0]}' or "
+                    f"'{CONSTRAINT_NAMES[ttype_1]}', but found "
                     f"'{self._get_current().lexeme}'.")
             modifier = self._previous()
-            name = modifier.ttype.name.lower()
+            name = CONSTRAINT_NAMES[modifier.ttype]
+            index = int(modifier.ttype == ttype_1)
 
             self._consume(TokenType.ASSIGN, f"Expect '=' after {name}.")
 
-            if constraints[name] is not None:
+            if constraints[index] is not None:
                 raise ParseError(modifier, f"Multiple definition of {name}.")
-            constraints[name] = self._parse_precedence_5()
+            # Stop above comparisons, so that the closing '>' is not parsed
+            # as an operator.
+            constraints[index] = self._parse_binary(5)
 
             if not self._match(TokenType.COMMA):
                 break
 
-        return constraints
+        return constraints[0], constraints[1]
 
     def _parse_statement(self) -> stmt.Stmt:
-        if self._match(TokenType.BREAK):
-            keyword = self._previous()
-            self._consume(TokenType.SEMICOLON, "Expect ';' after 'break'.")
-            return stmt.Break(keyword)
-        if self._match(TokenType.CONTINUE):
-            keyword = self._previous()
-            self._consume(TokenType.SEMICOLON, "Expect ';' after 'continue'.")
-            return stmt.Continue(keyword)
-        if self._match(TokenType.RETURN):
-            keyword = self._previous()
-            value = None
-            if not self._match(TokenType.SEMICOLON):
-                value = self._parse_expression()
-                self._consume(TokenType.SEMICOLON,
-                              "Expect ';' after return value.")
-            return stmt.Return(keyword, value)
-        if self._match(TokenType.IF):
+        method_name = STATEMENT_PARSERS.get(self._peek().ttype)
+        if method_name is None:
+            return self._parse_assign_or_tilde()
+
+        self._pop_token()
+        return getattr(self, method_name)()
+
+    def _parse_break(self) -> stmt.Break:
+        """Parse break statement. It is assumed that 'break' is consumed."""
+        keyword = self._previous()
+        self._consume(TokenType.SEMICOLON, "Expect ';' after 'break'.")
+        return stmt.Break(keyword)
+
+    def _parse_continue(self) -> stmt.Continue:
+        """Parse continue statement. Assume that 'continue' is consumed."""
+        keyword = self._previous()
+        self._consume(TokenType.SEMICOLON, "Expect ';' after 'continue'.")
+        return stmt.Continue(keyword)
+
+    def _parse_return(self) -> stmt.Return:
+        """Parse return statement. It is assumed that 'return' is consumed."""
+        keyword = self._previous()
+        value = None
+        if not self._match(TokenType.SEMICOLON):
+            value = self._parse_expression()
+            self._consume(TokenType.SEMICOLON,
+                          "Expect ';' after return value.")
+        return stmt.Return(keyword, value)
+
+    def _parse_if_else(self) -> stmt.IfElse:
+        """Parse if/else statement. It is assumed that 'if' is consumed.
+
+        'else if' chains are parsed in a loop, so that long chains do not
+        recurse once per branch.
+        """
+        branches = []
+        alternative = None
+        while True:
             self._consume(TokenType.LPAREN, "Expect '(' after 'if'.")
             condition = self._parse_expression()
             self._consume(TokenType.RPAREN, "Expect ')' after condition.")
-            consequent = self._parse_statement()
-            alternative = None
-            if self._match(TokenType.ELSE):
+            branches.append((condition, self._parse_statement()))
+            if not self._match(TokenType.ELSE):
+                break
+            if not self._match(TokenType.IF):
                 alternative = self._parse_statement()
-            return stmt.IfElse(condition, consequent, alternative)
-        if self._match(TokenType.WHILE):
-            self._consume(TokenType.LPAREN, "Expect '(' after 'while'.")
-            condition = self._parse_expression()
-            self._consume(TokenType.RPAREN, "Expect ')' after condition.")
-            body = self._parse_statement()
-            return stmt.While(condition, body)
-        if self._match(TokenType.FOR):
-            self._consume(TokenType.LPAREN, "Expect '(' after 'for'.")
-            identifier = self._consume(TokenType.IDENTIFIER,
-                                       "Expect identifier after '('.")
-            self._consume(TokenType.IN, "Expect 'in' after identifier.")
-            begin = self._parse_expression()
-            self._consume(TokenType.COLON, "Expect ':' after expression.")
-            end = self._parse_expression()
-            self._consume(TokenType.RPAREN, "Expect ')'.")
-            body = self._parse_statement()
-            return stmt.For(identifier, begin, end, body)
-        if self._match(TokenType.PRINT):
-            self._consume(TokenType.LPAREN, "Expect '(' after 'print'.")
-            expressions = [self._parse_expression()]
+                break
 
-            while self._match(TokenType.COMMA):
-                expressions.append(self._parse_expression())
+        condition, consequent = branches.pop(0)
+        for branch in reversed(branches):
+            alternative = stmt.IfElse(*branch, alternative)
+        return stmt.IfElse(condition, consequent, alternative)
+
+    def _parse_while(self) -> stmt.While:
+        """Parse while statement. It is assumed that 'while' is consumed."""
+        self._consume(TokenType.LPAREN, "Expect '(' after 'while'.")
+        condition = self._parse_expression()
+        self._consume(TokenType.RPAREN, "Expect ')' after condition.")
+        body = self._parse_statement()
+        return stmt.While(condition, body)
+
+    def _parse_for(self) -> stmt.For:
+        """Parse for statement. It is assumed that 'for' is consumed."""
+        self._consume(TokenType.LPAREN, "Expect '(' after 'for'.")
+        identifier = self._consume(TokenType.IDENTIFIER,
+                                   "Expect identifier after '('.")
+        self._consume(TokenType.IN, "Expect 'in' after identifier.")
+        begin = self._parse_expression()
+        self._consume(TokenType.COLON, "Expect ':' after expression.")
+        end = self._parse_expression()
+        self._consume(TokenType.RPAREN, "Expect ')'.")
+        body = self._parse_statement()
+        return stmt.For(identifier, begin, end, body)
 
-            self._consume(TokenType.RPAREN, "Expect ')' after expression.")
-            self._consume(TokenType.SEMICOLON, "Expect ';' after statement.")
-            return stmt.Print(expressions)
-        if self._match(TokenType.REJECT):
-            self._consume(TokenType.LPAREN, "Expect '(' after 'reject'.")
-            expressions = [self._parse_expression()]
+    def _parse_print(self) -> stmt.Print:
+        """Parse print statement. It is assumed that 'print' is consumed."""
+        self._consume(TokenType.LPAREN, "Expect '(' after 'print'.")
+        expressions = [self._parse_expression()]
 
-            while self._match(TokenType.COMMA):
-                expressions.append(self._parse_expression())
-
-            self._consume(TokenType.RPAREN, "Expect ')' after expression.")
-            self._consume(TokenType.SEMICOLON, "Expect ';' after statement.")
-            return stmt.Reject(expressions)
-        if self._match(TokenType.TARGET):
-            self._consume(TokenType.PLUSASSIGN)
-            expression = self._parse_expression()
-            self._consume(TokenType.SEMICOLON, "Expect ';' after expression.")
-            return stmt.TargetPlusAssign(expression)
-        if self._match(TokenType.LBRACE):
-            return self._parse_block()
-        if self._match(TokenType.SEMICOLON):
-            return stmt.Empty(self._previous())
+        while self._match(TokenType.COMMA):
+            expressions.append(self._parse_expression())
+
+        self._consume(TokenType.RPAREN, "Expect ')' after expression.")
+        self._consume(TokenType.SEMICOLON, "Expect ';' after statement.")
+        return stmt.Print(expressions)
+
+    def _parse_reject(self) -> stmt.Reject:
+        """Parse reject statement. It is assumed that 'reject' is consumed."""
+        self._consume(TokenType.LPAREN, "Expect '(' after 'reject'.")
+        expressions = [self._parse_expression()]
+
+        while self._match(TokenType.COMMA):
+            expressions.append(self._parse_expression())
+
+        self._consume(TokenType.RPAREN, "Expect ')' after expression.")
+        self._consume(TokenType.SEMICOLON, "Expect ';' after statement.")
+        return stmt.Reject(expressions)
+
+    def _parse_target_plus_assign(self) -> stmt.TargetPlusAssign:
+        """Parse target += statement. Assume that 'target' is consumed."""
+        self._consume(TokenType.PLUSASSIGN)
+        expression = self._parse_expression()
+        self._consume(TokenType.SEMICOLON, "Expect ';' after expression.")
+        return stmt.TargetPlusAssign(expression)
+
+    def _parse_empty(self) -> stmt.Empty:
+        """Parse empty statement. It is assumed that ';' is consumed."""
+        return stmt.Empty(self._previous())
 
+    def _parse_assign_or_tilde(self) -> Union[stmt.Assign, stmt.Tilde]:
+        """Parse assignment or tilde statement."""
         expression = self._parse_expression()
 
-        if self._match_any(*ASSIGNMENT_OPS):
+        if self._match_in(ASSIGNMENT_OPS):
             assignment_op = self._previous()
             value = self._parse_expression()
             self._consume(TokenType.SEMICOLON, "Expect ';' after assignment.")
@@ -673,7 +710,7 @@ class Parser:
     def _parse_block(self) -> stmt.Block:
         """Parse block. It is assumed that opening brace has been consumed."""
         declarations: List[stmt.Declaration] = []
-        while self._match_any(*VAR_TYPES):
+        while self._match_in(VAR_TYPES):
             declarations.append(self._parse_declaration())
 
         statements = []
@@ -1,9 +1,15 @@
 """Scan stan code."""
-from typing import Any, List
+import functools
+import re
+import sys
+from typing import Any, cast, Iterator, List
 
 from nast import error
 from nast.tokens import Token, TokenType, ComplexValue, RealValue
 
+# Run of ignored white space characters, including newlines
+WHITESPACE_RUN = re.compile(r"[ \t\n]*")
+
 # Reserved keywords mapped to corresponding token type
 STAN_KEYWORDS = {
     "functions": TokenType.FUNCTIONBLOCK,
@@ -48,14 +54,34 @@ STAN_KEYWORDS = {
     "target": TokenType.TARGET,
 }
 
+# First characters of reserved keywords. Identifiers starting with any other
+# character cannot be keywords, so the keyword lookup can be skipped.
+KEYWORD_FIRST_CHARS = frozenset(kw[0] for kw in STAN_KEYWORDS)
+
+# First words of reserved keywords containing white spaces
+MULTI_WORD_KEYWORD_PREFIXES = frozenset(
+    kw.split(" ")[0] for kw in STAN_KEYWORDS if " " in kw)
+
 
 class Scanner:
     """Scanner for Stan."""
 
-    # pylint: disable=too-few-public-methods
+    # pylint: disable=attribute-defined-outside-init
 
     def __init__(self, source: str):
+        self.reset(source)
+
+    def reset(self, source: str) -> None:
+        """Reset scanner state to scan new source code.
+
+        This allows to reuse a single Scanner instance for multiple sources.
+        Lists of tokens returned by previous scans are left untouched.
+
+        Args:
+            source: Stan source code to be scanned.
+        """
         self._source = source
+        self._source_length = len(source)
         self._tokens: List[Token] = []
 
         self._start = 0
@@ -69,26 +95,38 @@ class Scanner:
         Returns:
             List[Token]: list of scanned tokens from source code.
         """
-        # TODO refactor with list comprehension?
-        while not self._is_at_end():
+        self._tokens = list(self.iter_tokens())
+        return self._tokens
+
+    def iter_tokens(self) -> Iterator[Token]:
+        """Scan tokens lazily, one at a time.
+
+        Yields:
+            Token: scanned tokens from source code, the last one being EOF.
+        """
+        # Bind loop invariants to locals to avoid repeated attribute lookups.
+        source_length = self._source_length
+        scan_single_token = self._scan_single_token
+        # Buffer, each call of _scan_single_token adds at most one token.
+        tokens = self._tokens
+
+        while self._current < source_length:
             self._column += self._current - self._start
             self._start = self._current
-            self._scan_single_token()
+            scan_single_token()
 
-        self._column += self._current - self._start
-        self._tokens.append(
-            Token(ttype=TokenType.EOF, line=self._line, column=self._column))
+            if tokens:
+                yield tokens.pop()
 
-        return self._tokens
+        self._column += self._current - self._start
+        yield Token(ttype=TokenType.EOF, line=self._line, column=self._column)
 
     def _scan_single_token(self) -> None:
         char = self._pop_char()
 
-        if char == "\n":
-            self._increase_line()
-        elif char in [" ", "\t"]:
-            # ignore tabs and white spaces
-            pass
+        if char in " \t\n":
+            # ignore tabs, white spaces and newlines
+            self._scan_whitespace()
         elif char == "\"":
             self._scan_string()
         elif char == "{":
@@ -199,13 +237,34 @@ class Scanner:
             else:
                 raise ValueError(f"Unknown character '{char}'.")
 
+    def _scan_whitespace(self) -> None:
+        """Skip a run of white space. Assume the first char was consumed."""
+        source = self._source
+        start = self._start
+        # The `*` pattern also matches the empty string, so never None
+        match = cast(re.Match[str],
+                     WHITESPACE_RUN.match(source, self._current))
+        end = match.end()
+        self._current = end
+
+        newlines = source.count("\n", start, end)
+        if newlines:
+            self._line += newlines
+            # Column of `end`, counted from the last newline in the run
+            self._column = end - source.rfind("\n", start, end)
+            self._start = end
+
     def _scan_identifier(self) -> None:
         self._scan_while_char()
 
         text = self._get_start_to_current()
 
+        if text[0] not in KEYWORD_FIRST_CHARS:
+            self._add_token(TokenType.IDENTIFIER)
+            return
+
         # Special case: reserved keywords containing white spaces
-        if text in {kw.split(" ")[0] for kw in STAN_KEYWORDS if " " in kw}:
+        if text in MULTI_WORD_KEYWORD_PREFIXES:
             self._pop_char()  # advance single whitespace
             self._scan_while_char()
             text = self._get_start_to_current()
@@ -215,13 +274,20 @@ class Scanner:
         self._add_token(token_type)
 
     def _scan_while_char(self):
-        while is_identifier_char(self._peek(), is_first_char=False):
-            self._pop_char()
+        source = self._source
+        source_length = self._source_length
+        current = self._current
+
+        while (current < source_length
+               and is_identifier_char(source[current], is_first_char=False)):
+            current += 1
+
+        self._current = current
 
     def _scan_one_line_comment(self) -> None:
         """ Scan until EOF or newline is encountered."""
-        while not self._is_at_end() and self._peek() != "\n":
-            self._pop_char()
+        end = self._source.find("\n", self._current)
+        self._current = self._source_length if end == -1 else end
 
     def _get_start_to_current(self):
         return self._get_to_current(self._start)
@@ -259,7 +325,7 @@ class Scanner:
 
         if self._match("i"):
             self._add_token(TokenType.IMAGNUMERAL,
-                            ComplexValue(RealValue(int(literal), 0, 0)))
+                            complex_value(int(literal), 0, 0))
             return
 
         self._add_token(TokenType.INTNUMERAL, int(literal))
@@ -306,15 +372,17 @@ class Scanner:
         if self._match("i"):
             self._add_token(
                 TokenType.IMAGNUMERAL,
-                ComplexValue(
-                    RealValue(integer_part, non_integer_part, exponent)))
+                complex_value(integer_part, non_integer_part, exponent))
             return
 
         self._add_token(TokenType.REALNUMERAL,
-                        RealValue(integer_part, non_integer_part, exponent))
+                        real_value(integer_part, non_integer_part, exponent))
 
     def _add_token(self, ttype: TokenType, literal: Any = None) -> None:
         lexeme = self._source[self._start:self._current]
+        if literal is None:
+            # Keywords, operators and identifiers repeat a lot, share them.
+            lexeme = sys.intern(lexeme)
 
         self._tokens.append(
             Token(ttype=ttype,
@@ -324,7 +392,7 @@ class Scanner:
                   column=self._column))
 
     def _is_at_end(self, offset: int = 0) -> bool:
-        return self._current + offset >= len(self._source)
+        return self._current + offset >= self._source_length
 
     def _pop_char(self) -> str:
         """Advance by a single character."""
@@ -334,7 +402,7 @@ class Scanner:
 
     def _peek(self, offset=0) -> str:
         """Peek at `offset` characters ahead (n=0 means current token)."""
-        if self._current + offset >= len(self._source):
+        if self._current + offset >= self._source_length:
             return "\0"
 
         return self._source[self._current + offset]
@@ -349,10 +417,6 @@ class Scanner:
         self._current += len(expected)
         return True
 
-    def _increase_line(self):
-        self._line += 1
-        self._column = 0
-
 
 def is_valid_string_literal_char(char: str) -> bool:
     """Return if a char is valid to be used in a string literal."""
@@ -373,3 +437,17 @@ def is_identifier_char(char: str, is_first_char: bool) -> bool:
     if is_first_char and (char.isdigit() or char == "_"):
         return False
     return char.isalpha() or char.isdigit() or char == "_"
+
+
+@functools.lru_cache(maxsize=512)
+def real_value(integer_part: int, non_integer_part: int,
+               exponent: int) -> RealValue:
+    """Return RealValue, sharing instances for repeated literals."""
+    return RealValue(integer_part, non_integer_part, exponent)
+
+
+@functools.lru_cache(maxsize=512)
+def complex_value(integer_part: int, non_integer_part: int,
+                  exponent: int) -> ComplexValue:
+    """Return ComplexValue, sharing instances for repeated literals."""
+    return ComplexValue(real_value(integer_part, non_integer_part, exponent))
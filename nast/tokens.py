@@ -1,10 +1,14 @@
 """Stan tokens."""
-from enum import auto, Enum
+from enum import auto, IntEnum
 from typing import Any, NamedTuple
 
 
-class TokenType(Enum):
-    """Token type for Stan."""
+class TokenType(IntEnum):
+    """Token type for Stan.
+
+    Members are small consecutive integers, starting at 1, so they can be
+    used directly as indices into lookup tables.
+    """
     NEWLINE = auto()
     SPACE = auto()
 
@@ -116,6 +120,11 @@ class TokenType(Enum):
 
     EOF = auto()
 
+    def __str__(self) -> str:
+        # Keep `TokenType.X` as string representation, also in f-strings
+        # (IntEnum formats as int otherwise).
+        return f"TokenType.{self.name}"
+
 
 class Token(NamedTuple):
     """Token.
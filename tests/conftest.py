@@ -0,0 +1,36 @@
+"""Shared fixtures for tests."""
+import functools
+from typing import Callable, Tuple
+
+import pytest
+
+from nast import stmt
+from nast.parsing import Parser
+from nast.scanner import Scanner
+from nast.tokens import Token
+
+
+@pytest.fixture(name="scan_tokens", scope="session")
+def scan_tokens_fixture() -> Callable[[str], Tuple[Token, ...]]:
+    """Factory scanning source code, cached per source."""
+
+    @functools.lru_cache(maxsize=None)
+    def _scan_tokens(code: str) -> Tuple[Token, ...]:
+        return tuple(Scanner(code).scan_tokens())
+
+    return _scan_tokens
+
+
+@pytest.fixture(name="parse_program", scope="session")
+def parse_program_fixture(scan_tokens) -> Callable[[str], stmt.Program]:
+    """Factory scanning and parsing Stan programs, cached per source.
+
+    The same Program instance is returned to every test parsing a given
+    source, so tests must not modify it.
+    """
+
+    @functools.lru_cache(maxsize=None)
+    def _parse_program(code: str) -> stmt.Program:
+        return Parser(scan_tokens(code)).parse_program()
+
+    return _parse_program
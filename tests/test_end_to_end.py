@@ -1,50 +1,32 @@
 """End-to-end tests involing scanning and parsing."""
-import pytest
-
-from nast import parsing
-from nast import scanner
+import sys
+import textwrap
+from typing import Dict, Tuple
 
-# pylint: disable=protected-access
+import pytest
 
+from nast import stmt
+from nast.tokens import TokenType
 
-def test_simple():
-    """Test a single parameter model."""
-    code = """
+# Single parameter model
+SIMPLE_CODE = textwrap.dedent("""
         parameters {
           real a;
         }
-        """
-    lexer = scanner.Scanner(code)
-    tokens = lexer.scan_tokens()
-
-    parser = parsing.Parser(tokens)
-
-    result = parser.parse_program()
+        """)
 
-    print(result)
-
-
-def test_simple_normal():
-    """Test a simple model sampling from a normal distribution."""
-    code = """
+# Simple model sampling from a normal distribution
+SIMPLE_NORMAL_CODE = textwrap.dedent("""
         parameters {
           real a;   // a variable
         }
         model {
             a ~ normal(0, 1);   // standard normal
         }
-        """
-    lexer = scanner.Scanner(code)
-    tokens = lexer.scan_tokens()
-
-    parser = parsing.Parser(tokens)
-
-    _ = parser.parse_program()
+        """)
 
-
-def test_eight_schools():
-    """Test infamous 8 schools model."""
-    code = """
+# Infamous 8 schools model
+EIGHT_SCHOOLS_CODE = textwrap.dedent("""
         data {
           int<lower=0> J;         // number of schools
           real y[J];              // estimated treatment effects
@@ -62,18 +44,10 @@ def test_eight_schools():
           target += normal_lpdf(eta | 0, 1);       // prior log-density
           target += normal_lpdf(y | theta, sigma); // log-likelihood
         }
-        """
-    lexer = scanner.Scanner(code)
-    tokens = lexer.scan_tokens()
-
-    parser = parsing.Parser(tokens)
-
-    _ = parser.parse_program()
+        """)
 
-
-def test_all_blocks():
-    """Test program with all blocks."""
-    code = """
+# Program with all blocks
+ALL_BLOCKS_CODE = textwrap.dedent("""
     functions {
       real relative_diff(real x, real y) {
         real abs_diff;
@@ -87,9 +61,9 @@ def test_all_blocks():
         int M;
         real x[M];
     }
-    tranformed data {
+    transformed data {
         int M_squared;
-        int x_squared;
+        real x_squared[M];
 
         M_squared = M^2;
         x_squared = x.^2;
@@ -109,23 +83,12 @@ def test_all_blocks():
       real rdiff;
       rdiff = relative_diff(alpha, beta);
     }
-    """
-
-    lexer = scanner.Scanner(code)
-    tokens = lexer.scan_tokens()
-
-    parser = parsing.Parser(tokens)
-
-    _ = parser.parse_program()
-
+    """)
 
-def test_dawid_skene():
-    """Test Dawid and Skene model.
-
-    Source: https://mc-stan.org/docs/2_19/stan-users-guide/
-    data-coding-and-diagnostic-accuracy-models.html
-    """
-    code = """data {
+# Dawid and Skene model, see https://mc-stan.org/docs/2_19/stan-users-guide/
+# data-coding-and-diagnostic-accuracy-models.html
+DAWID_SKENE_CODE = textwrap.dedent("""
+    data {
       int<lower=2> K;
       int<lower=1> I;
       int<lower=1> J;
@@ -158,42 +121,145 @@ def test_dawid_skene():
       for (i in 1:I)
         target += log_sum_exp(log_q_z[i]);
     }
+    """)
+
+# Expected numbers of declarations and statements per non-empty block
+SIMPLE_BLOCK_SIZES = {"parameters": (1, 0)}
+SIMPLE_NORMAL_BLOCK_SIZES = {"parameters": (1, 0), "model": (0, 1)}
+EIGHT_SCHOOLS_BLOCK_SIZES = {
+    "data": (3, 0),
+    "parameters": (3, 0),
+    "transformed_parameters": (1, 0),
+    "model": (0, 2),
+}
+ALL_BLOCKS_BLOCK_SIZES = {
+    "functions": (0, 1),
+    "data": (2, 0),
+    "transformed_data": (2, 2),
+    "parameters": (2, 0),
+    "transformed_parameters": (1, 0),
+    "model": (0, 2),
+    "generated_quantities": (1, 1),
+}
+DAWID_SKENE_BLOCK_SIZES = {
+    "data": (6, 0),
+    "parameters": (2, 0),
+    "transformed_parameters": (1, 1),
+    "model": (0, 3),
+}
+
+# Program block attribute names mapped to the tokens opening the blocks
+BLOCK_TTYPES = {
+    "functions": TokenType.FUNCTIONBLOCK,
+    "data": TokenType.DATABLOCK,
+    "transformed_data": TokenType.TRANSFORMEDDATABLOCK,
+    "parameters": TokenType.PARAMETERSBLOCK,
+    "transformed_parameters": TokenType.TRANSFORMEDPARAMETERSBLOCK,
+    "model": TokenType.MODELBLOCK,
+    "generated_quantities": TokenType.GENERATEDQUANTITIESBLOCK,
+}
+
+# Test programs keyed by name
+PROGRAMS = {
+    "simple": SIMPLE_CODE,
+    "simple_normal": SIMPLE_NORMAL_CODE,
+    "eight_schools": EIGHT_SCHOOLS_CODE,
+    "all_blocks": ALL_BLOCKS_CODE,
+    "dawid_skene": DAWID_SKENE_CODE,
+}
+
+# Expected numbers of tokens (including EOF) per program
+NUM_TOKENS = {
+    "simple": 7,
+    "simple_normal": 19,
+    "eight_schools": 89,
+    "all_blocks": 142,
+    "dawid_skene": 228,
+}
+
+# Expected block sizes per program
+BLOCK_SIZES = {
+    "simple": SIMPLE_BLOCK_SIZES,
+    "simple_normal": SIMPLE_NORMAL_BLOCK_SIZES,
+    "eight_schools": EIGHT_SCHOOLS_BLOCK_SIZES,
+    "all_blocks": ALL_BLOCKS_BLOCK_SIZES,
+    "dawid_skene": DAWID_SKENE_BLOCK_SIZES,
+}
+
+FUNCTION_DECLARATIONS = (
+    "vector func();",
+    "int func(int a, int b);",
+    "array[] int foobar(array[] int a, int n);",
+)
+
+FUNCTION_DEFINITIONS = (
+    """array[] real func_0(real a) {
+            return func_1(a * 3); }""",
+    """array[] vector func_0(int c, real a) {
+            return func_1(a * 3 + c); }""",
+)
+
+
+def _block_sizes(program: stmt.Program) -> Dict[str, Tuple[int, int]]:
+    """Number of declarations and statements per non-empty program block."""
+    return {
+        name: (len(block.declarations), len(block.statements))
+        for name, block in vars(program).items() if block is not None
+    }
+
+
+@pytest.mark.parametrize("program", PROGRAMS)
+def test_scan_program(program, scan_tokens):
+    """End-to-end test for scanning Stan programs.
+
+    Checks the number of tokens and the tokens opening program blocks.
     """
+    result = scan_tokens(PROGRAMS[program])
 
-    lexer = scanner.Scanner(code)
-    tokens = lexer.scan_tokens()
+    assert len(result) == NUM_TOKENS[program]
+    assert result[-1].ttype == TokenType.EOF
+    block_ttypes = set(BLOCK_TTYPES.values())
+    assert [token.ttype for token in result if token.ttype in block_ttypes
+            ] == [BLOCK_TTYPES[name] for name in BLOCK_SIZES[program]]
 
-    parser = parsing.Parser(tokens)
 
-    _ = parser.parse_program()
+@pytest.mark.parametrize("program", PROGRAMS)
+def test_parse_program(program, parse_program):
+    """End-to-end test for scanning and parsing Stan programs.
 
+    Compares the numbers of declarations and statements parsed for each
+    program block.
+    """
+    result = parse_program(PROGRAMS[program])
 
-@pytest.mark.parametrize("source", [
-    "vector func();", "int func(int a, int b);",
-    "array[] int foobar(array[] int a, int n);"
-])
-def test_parse_function_declaration(source):
-    """End-to-end test for scanning and parsing function declarations."""
-    lexer = scanner.Scanner(source)
-    tokens = lexer.scan_tokens()
+    assert _block_sizes(result) == BLOCK_SIZES[program]
 
-    parser = parsing.Parser(tokens)
 
-    _ = parser._parse_function_declaration_or_definition()
+@pytest.mark.parametrize("source", FUNCTION_DECLARATIONS)
+def test_parse_function_declaration(source, parse_program):
+    """End-to-end test for scanning and parsing function declarations."""
+    result = parse_program(f"functions {{ {source} }}")
 
+    assert len(result.functions.statements) == 1
+    assert isinstance(result.functions.statements[0], stmt.FunctionDeclaration)
 
-@pytest.mark.parametrize("source", [
-    """array[] real func_0(real a) {
-            return func_1(a * 3); }
-        }""", """array[] vector func_0(int c, real a) {
-            return func_1(a * 3 + c); }
-        }"""
-])
-def test_parse_function_definition(source):
+
+@pytest.mark.parametrize("source", FUNCTION_DEFINITIONS)
+def test_parse_function_definition(source, parse_program):
     """End-to-end test for scanning and parsing function definitions."""
-    lexer = scanner.Scanner(source)
-    tokens = lexer.scan_tokens()
+    result = parse_program(f"functions {{ {source} }}")
+
+    assert len(result.functions.statements) == 1
+    assert isinstance(result.functions.statements[0], stmt.FunctionDefinition)
+
+
+def test_parse_long_else_if_chain(parse_program):
+    """'else if' chains longer than the recursion limit can be parsed."""
+    num_branches = 2 * sys.getrecursionlimit()
+    source = " else ".join(f"if (x == {i}) y = {i};"
+                           for i in range(num_branches))
 
-    parser = parsing.Parser(tokens)
+    result = parse_program(f"model {{ {source} }}")
 
-    _ = parser._parse_function_declaration_or_definition()
+    assert len(result.model.statements) == 1
+    assert isinstance(result.model.statements[0], stmt.IfElse)
@@ -13,17 +13,35 @@ class TestParser:
     # pylint: disable=no-self-use, protected-access, too-many-arguments
 
     @pytest.fixture(name="lexer")
-    def lexer_fixture(self, mocker):
-        """Scanner instance."""
-        lexer = parsing.Parser(mocker.MagicMock())
+    def lexer_fixture(self):
+        """Parser instance without tokens, for tests patching _peek."""
+        lexer = parsing.Parser([])
         yield lexer
 
+    def test_reset(self):
+        """Test Parser.reset."""
+        lexer = parsing.Parser([
+            Token(TokenType.BREAK, 1, 1, "break"),
+            Token(TokenType.EOF, 1, 6)
+        ])
+        lexer._pop_token()
+        token_list = [
+            Token(TokenType.CONTINUE, 1, 1, "continue"),
+            Token(TokenType.EOF, 1, 9)
+        ]
+
+        lexer.reset(token_list)
+
+        assert lexer._current == 0
+        assert lexer._pop_token() == token_list[0]
+
     @pytest.mark.parametrize("current,expected", [(0, 1), (10, 11), (25, 26)])
     def test_pop_token_increments(self, lexer, current, expected, mocker):
-        """Test that _pop_token increases _current if not _is_at_end = True."""
+        """Test that _pop_token increases _current if not at EOF."""
         lexer._current = current
-        mocker.patch.object(lexer, "_peek")
-        mocker.patch.object(lexer, "_is_at_end", return_value=False)
+        mocker.patch.object(lexer,
+                            "_peek",
+                            return_value=Token(TokenType.SEMICOLON, 1, 1))
 
         lexer._pop_token()
 
@@ -31,43 +49,47 @@ class TestParser:
 
     @pytest.mark.parametrize("current,expected", [(0, 0), (10, 10), (25, 25)])
     def test_pop_token_not_increments(self, lexer, current, expected, mocker):
-        """Test that _pop_token increases _current if not _is_at_end = True."""
+        """Test that _pop_token does not increase _current at EOF."""
         lexer._current = current
-        mocker.patch.object(lexer, "_peek")
-        mocker.patch.object(lexer, "_is_at_end", return_value=True)
+        mocker.patch.object(lexer,
+                            "_peek",
+                            return_value=Token(TokenType.EOF, 1, 1))
 
         lexer._pop_token()
 
         assert lexer._current == expected
 
     @pytest.mark.parametrize(
-        "args,peek_token,is_at_end,expected",
+        "args,peek_token,expected",
         [([TokenType.PLUS, TokenType.BANG], Token(TokenType.BANG, 2, 3),
-          False, True),
-         ([TokenType.BANG, TokenType.PLUS], Token(TokenType.BANG, 1, 1),
-          True, False),
+          True),
+         ([TokenType.BANG, TokenType.PLUS], Token(TokenType.EOF, 1, 1),
+          False),
          ([TokenType.SEMICOLON, TokenType.AND], Token(TokenType.COLON, 3, 8),
-          False, False),
-         ([TokenType.OR, TokenType.SEMICOLON], Token(TokenType.COLON, 9, 7),
-          True, False)])  # yapf: disable
-    def test_check_any(self, lexer, args, peek_token, is_at_end, expected,
-                       mocker):
-        """Test Parser._check"""
-        mocker.patch.object(lexer, "_is_at_end", return_value=is_at_end)
+          False),
+         ([TokenType.OR, TokenType.EOF], Token(TokenType.EOF, 9, 7),
+          False)])  # yapf: disable
+    def test_check_in(self, lexer, args, peek_token, expected, mocker):
+        """Test Parser._check_in."""
         mocker.patch.object(lexer, "_peek", return_value=peek_token)
 
-        result = lexer._check_any(*args)
+        result = lexer._check_in(frozenset(args))
 
         assert result == expected
 
-    def test_check(self, lexer, mocker):
+    @pytest.mark.parametrize(
+        "ttype,peek_token,expected",
+        [(TokenType.BANG, Token(TokenType.BANG, 2, 3), True),
+         (TokenType.BANG, Token(TokenType.EOF, 1, 1), False),
+         (TokenType.SEMICOLON, Token(TokenType.COLON, 3, 8), False),
+         (TokenType.EOF, Token(TokenType.EOF, 9, 7), False)])  # yapf: disable
+    def test_check(self, lexer, ttype, peek_token, expected, mocker):
         """Test Parser._check."""
-        mocker.patch.object(lexer, "_check_any")
-        mocked_ttype = mocker.Mock()
+        mocker.patch.object(lexer, "_peek", return_value=peek_token)
 
-        _ = lexer._check(mocked_ttype)
+        result = lexer._check(ttype)
 
-        lexer._check_any.assert_called_once_with(mocked_ttype)
+        assert result == expected
 
     @pytest.mark.parametrize(
         "ttypes,check_ttype,expected",
@@ -78,27 +100,30 @@ class TestParser:
            ], TokenType.MINUS, True),
          ([TokenType.BANG, TokenType.PLUS, TokenType.MINUS
            ], TokenType.TIMES, False)])
-    def test_match_any(self, lexer, ttypes, check_ttype, expected, mocker):
-        """Test Parser._match_any."""
-        mocker.patch.object(lexer, "_check", new=lambda x: x == check_ttype)
-        mocker.patch.object(lexer, "_pop_token")
+    def test_match_in(self, ttypes, check_ttype, expected):
+        """Test Parser._match_in."""
+        lexer = parsing.Parser(
+            [Token(check_ttype, 1, 1),
+             Token(TokenType.EOF, 1, 2)])
 
-        result = lexer._match_any(*ttypes)
+        result = lexer._match_in(frozenset(ttypes))
 
         assert result == expected
+        assert lexer._current == (1 if expected else 0)
 
-    def test_match(self, lexer, mocker):
+    @pytest.mark.parametrize("ttype,expected", [(TokenType.BANG, True),
+                                                (TokenType.PLUS, False),
+                                                (TokenType.EOF, False)])
+    def test_match(self, ttype, expected):
         """Test Parser._match."""
-        mocked_return_value = mocker.MagicMock()
-        mocker.patch.object(lexer,
-                            "_match_any",
-                            return_value=mocked_return_value)
+        lexer = parsing.Parser(
+            [Token(TokenType.BANG, 1, 1),
+             Token(TokenType.EOF, 1, 2)])
 
-        mocked_ttype = mocker.MagicMock()
-        result = lexer._match(mocked_ttype)
+        result = lexer._match(ttype)
 
-        lexer._match_any.assert_called_once_with(mocked_ttype)
-        assert result is mocked_return_value
+        assert result == expected
+        assert lexer._current == (1 if expected else 0)
 
     @pytest.mark.parametrize("token_list,current,ttypes,expected_index", [
         ([Token(TokenType.BANG, 1, 1), Token(TokenType.EOF, 1, 2)], 0,
@@ -209,6 +234,7 @@ class TestParser:
         (TokenType.ELTTIMES, ".*", True),
         (TokenType.ELTTIMES, ".*", True),
         (TokenType.HAT, "^", False),
+        (TokenType.ELTPOW, ".^", False),
     ])
     def test_binary_op(self, ttype, lexeme, left_associative, mocker):
         """Test binary operation.
@@ -279,6 +305,29 @@ class TestParser:
 
         assert result == expected
 
+    def test_eltpow_binds_tighter_than_unary_minus(self):
+        """Test that `-x.^2` is parsed as `-(x.^2)`."""
+        token_list = [
+            Token(TokenType.MINUS, 1, 1, "-"),
+            Token(TokenType.IDENTIFIER, 1, 2, "x"),
+            Token(TokenType.ELTPOW, 1, 3, ".^"),
+            Token(TokenType.INTNUMERAL, 1, 5, "2", 2),
+            Token(TokenType.EOF, 1, 6, ""),
+        ]
+
+        expected = expr.Unary(
+            Token(TokenType.MINUS, 1, 1, "-"),
+            expr.ArithmeticBinary(
+                expr.Variable(Token(TokenType.IDENTIFIER, 1, 2, "x")),
+                Token(TokenType.ELTPOW, 1, 3, ".^"),
+                expr.Literal(Token(TokenType.INTNUMERAL, 1, 5, "2", 2))))
+
+        lexer = parsing.Parser(token_list)
+
+        result = lexer._parse_expression()
+
+        assert result == expected
+
     def test_parse_function_application(self):
         """Test parsing function call of the form Identifier(arg0,arg1)."""
         token_list = [
@@ -11,6 +11,13 @@ TWO_CHAR_EOF = Token(TokenType.EOF, 1, 3, "")
 THREE_CHAR_EOF = Token(TokenType.EOF, 1, 4, "")
 
 
+def assert_tokens_equal(tokens, expected_tokens):
+    """Assert equality of token lists, stopping at the first mismatch."""
+    assert len(tokens) == len(expected_tokens)
+    for token, expected_token in zip(tokens, expected_tokens):
+        assert token == expected_token
+
+
 @pytest.mark.functional
 @pytest.mark.parametrize("source,expected_tokens", [
     ("\n", [
@@ -86,6 +93,11 @@ THREE_CHAR_EOF = Token(TokenType.EOF, 1, 4, "")
         Token(TokenType.RBRACE, 3, 1, "}"),
         Token(TokenType.EOF, 3, 2, ""),
     ]),
+    ("a \n\n\t b", [
+        Token(TokenType.IDENTIFIER, 1, 1, "a"),
+        Token(TokenType.IDENTIFIER, 3, 3, "b"),
+        Token(TokenType.EOF, 3, 4, ""),
+    ]),
 ])
 def test_scan_source(source, expected_tokens):
     """Functional test to test source code snippets."""
@@ -96,7 +108,7 @@ def test_scan_source(source, expected_tokens):
     lexer.scan_tokens()
 
     # THEN the scanned list of tokens is as expected
-    assert lexer._tokens == expected_tokens
+    assert_tokens_equal(lexer._tokens, expected_tokens)
 
 
 @pytest.mark.functional
@@ -143,6 +155,8 @@ def test_scan_source(source, expected_tokens):
     ("identifiername", TokenType.IDENTIFIER),
     ("identifier_name", TokenType.IDENTIFIER),
     ("identifier_name", TokenType.IDENTIFIER),
+    ("database", TokenType.IDENTIFIER),
+    ("xi", TokenType.IDENTIFIER),
 ])
 def test_scan_source_keyword(keyword, token_type):
     """Simple functional test for scanning reserved keywords.
@@ -161,7 +175,7 @@ def test_scan_source_keyword(keyword, token_type):
     lexer.scan_tokens()
 
     # THEN the scanned list of tokens is as expected
-    assert lexer._tokens == expected_tokens
+    assert_tokens_equal(lexer._tokens, expected_tokens)
 
 
 @pytest.mark.functional
@@ -193,7 +207,63 @@ def test_scan_literal(keyword, token_type, literal):
     lexer.scan_tokens()
 
     # THEN the scanned list of tokens is as expected
-    assert lexer._tokens == expected_tokens
+    assert_tokens_equal(lexer._tokens, expected_tokens)
+
+
+def test_scan_source_interns_lexemes():
+    """Test that repeated lexemes are shared between tokens."""
+    source = "real abc;\nreal abc;"
+
+    lexer = scanner.Scanner(source)
+    tokens = lexer.scan_tokens()
+
+    assert len(tokens) == 7
+    for token_0, token_1 in zip(tokens[:3], tokens[3:6]):
+        assert token_0.lexeme is token_1.lexeme
+
+
+def test_iter_tokens():
+    """Test that iter_tokens yields the scanned tokens."""
+    source = "real<lower=0> abc; // comment\n abc ~ normal(0, 1.2);"
+    expected_tokens = [
+        Token(TokenType.REAL, 1, 1, "real"),
+        Token(TokenType.LABRACK, 1, 5, "<"),
+        Token(TokenType.LOWER, 1, 6, "lower"),
+        Token(TokenType.ASSIGN, 1, 11, "="),
+        Token(TokenType.INTNUMERAL, 1, 12, "0", 0),
+        Token(TokenType.RABRACK, 1, 13, ">"),
+        Token(TokenType.IDENTIFIER, 1, 15, "abc"),
+        Token(TokenType.SEMICOLON, 1, 18, ";"),
+        Token(TokenType.IDENTIFIER, 2, 2, "abc"),
+        Token(TokenType.TILDE, 2, 6, "~"),
+        Token(TokenType.IDENTIFIER, 2, 8, "normal"),
+        Token(TokenType.LPAREN, 2, 14, "("),
+        Token(TokenType.INTNUMERAL, 2, 15, "0", 0),
+        Token(TokenType.COMMA, 2, 16, ","),
+        Token(TokenType.REALNUMERAL, 2, 18, "1.2", RealValue(1, 2)),
+        Token(TokenType.RPAREN, 2, 21, ")"),
+        Token(TokenType.SEMICOLON, 2, 22, ";"),
+        Token(TokenType.EOF, 2, 23, ""),
+    ]
+
+    result = list(scanner.Scanner(source).iter_tokens())
+
+    assert_tokens_equal(result, expected_tokens)
+
+
+def test_iter_tokens_is_lazy():
+    """Test that iter_tokens scans only as far as tokens are requested."""
+    lexer = scanner.Scanner("real<lower=0> abc;")
+    tokens = lexer.iter_tokens()
+
+    # Nothing is scanned before the first token is requested
+    assert lexer._current == 0
+
+    assert next(tokens) == Token(TokenType.REAL, 1, 1, "real")
+    assert lexer._current == len("real")
+
+    assert next(tokens) == Token(TokenType.LABRACK, 1, 5, "<")
+    assert lexer._current == len("real<")
 
 
 class TestScanner:
@@ -223,6 +293,22 @@ class TestScanner:
         # THEN the result is as expected
         assert result == expected
 
+    def test_reset(self):
+        """Test reset."""
+        # GIVEN a Scanner instance that has already scanned some source
+        scnnr = scanner.Scanner("real a;\n")
+        previous_tokens = scnnr.scan_tokens()
+        num_previous_tokens = len(previous_tokens)
+
+        # WHEN the scanner is reset with new source and scans again
+        scnnr.reset("{")
+        result = scnnr.scan_tokens()
+
+        # THEN the new tokens are as if scanned by a fresh instance...
+        assert result == [Token(TokenType.LBRACE, 1, 1, "{"), ONE_CHAR_EOF]
+        # ... and the previously returned tokens are unchanged
+        assert len(previous_tokens) == num_previous_tokens
+
 
 @pytest.mark.parametrize("char,expected", [(" ", True), ("a", True),
                                            ("8", True), ("#", True),
@@ -252,3 +338,16 @@ def test_is_identifier_char(char, is_first_char, expected):
     result = scanner.is_identifier_char(char, is_first_char)
 
     assert result == expected
+
+
+@pytest.mark.parametrize("value_fn,expected", [
+    (scanner.real_value, RealValue(1, 5, -2)),
+    (scanner.complex_value, ComplexValue(RealValue(1, 5, -2))),
+])
+def test_literal_values_are_shared(value_fn, expected):
+    """Test scanner.real_value and scanner.complex_value."""
+    result_0 = value_fn(1, 5, -2)
+    result_1 = value_fn(1, 5, -2)
+
+    assert result_0 == expected
+    assert result_0 is result_1
@@ -0,0 +1,15 @@
+"""Tests for tokens.py module."""
+import pytest
+
+from nast.tokens import TokenType
+
+
+@pytest.mark.parametrize("ttype,expected", [
+    (TokenType.MINUS, "TokenType.MINUS"),
+    (TokenType.IDENTIFIER, "TokenType.IDENTIFIER"),
+    (TokenType.EOF, "TokenType.EOF"),
+])
+def test_token_type_str(ttype, expected):
+    """Test str() and f-string formatting of TokenType members."""
+    assert str(ttype) == expected
+    assert f"{ttype}" == expected